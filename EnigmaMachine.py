@@ -1,10 +1,105 @@
+from array import array
+
+# Translation tables between the ascii letters and the signal letters [0, 25]
+_LETTERS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_FROM_ASCII = bytes.maketrans(_LETTERS, bytes(range(26)) * 2)
+_TO_UPPER = bytes.maketrans(bytes(range(26)), _LETTERS[:26])
+
+# Padding to make a 26 byte mapping into a full 256 byte table for bytes.translate()
+_PAD = bytes(230)
+
+
+def _compose_wiring(right_tables, left_tables, positions, reflector):
+    """
+    Composes the given rotors and the reflector into a single mapping. That is, the signal letter that would come
+        back out of the right side of the given rotors should a signal letter come in at that index
+    :param right_tables: a list of the right_table of each rotor
+    :param left_tables: a list of the left_table of each rotor
+    :param positions: a list of the positions of each rotor
+    :param reflector: the reflector plate mapping
+    :return: a bytes of size 26
+    """
+    # Wrap each rotor around the reflector, starting with the one closest to it. Composing two mappings is just a
+    #   bytes.translate(), which does the whole table lookup at once in C, so long as the table is padded out to 256
+    ret = bytes(reflector)
+    for right, left, p in zip(right_tables, left_tables, positions):
+        ret = right[p].translate(ret + _PAD).translate(left[p] + _PAD)
+    return ret
+
+
+def _encode_kernel(data, entry_tables, exit_tables, first_turnovers, carries, right_tables, left_tables, turnovers,
+                   positions, reflector, wirings, out):
+    """
+    The inner loop of EnigmaMachine.encode(). Works only on plain integers and lookup tables so that no
+        Rotor/Reflector methods need to be called for each character.
+    Only the first (rightmost) rotor moves on most key presses, so every other rotor and the reflector are composed
+        into a single wiring with _compose_wiring(), which only needs to be rebuilt when one of those rotors turns.
+        The plugboard is folded into the first rotor's tables, so each character is only three lookups.
+        Composed wirings are memoized in wirings, so they are only ever composed once for a given machine setup
+    :param data: a bytes of the signal letters [0, 25] to encode
+    :param entry_tables: the first rotor's tables going in (see EnigmaMachine._first_rotor_tables()), twice over so
+        that a run of up to 26 positions can be sliced out without wrapping
+    :param exit_tables: the first rotor's tables coming back out, also twice over
+    :param first_turnovers: a list of the turnover positions of the first rotor
+    :param carries: the indices of every rotor but the first, in the order they are carried into (right to left)
+    :param right_tables: a list of the right_table of each rotor, in the same order as the machine's rotors
+    :param left_tables: a list of the left_table of each rotor
+    :param turnovers: a list of the turnover bitmasks of each rotor
+    :param positions: an array of the positions of each rotor. This is updated in place as the rotors rotate
+    :param reflector: the reflector plate mapping
+    :param wirings: a dictionary of already composed wirings keyed by the positions of every rotor but the first, see
+        EnigmaMachine._wiring_cache(). New wirings are added to it
+    :param out: a bytearray the same size as data that the encoded uppercase ascii bytes are written into
+    """
+    rest = len(positions) - 1
+    pos = positions[rest]
+    wiring = None
+
+    # Work through the data in runs of key presses that do not carry over the first rotor, so that only the first
+    #   key press of each run needs to check the turnovers
+    i = 0
+    while i < len(data):
+        if carries and pos in first_turnovers:
+            for r in carries:
+                carry = (turnovers[r] >> positions[r]) & 1
+                positions[r] = (positions[r] + 1) % 26
+                if not carry:
+                    break
+            wiring = None
+
+        if wiring is None:
+            key = tuple(positions[:rest])
+            wiring = wirings.get(key)
+            if wiring is None:
+                wiring = wirings[key] = _compose_wiring(right_tables[:rest], left_tables[:rest], key, reflector)
+
+        # A run can be at most 26 key presses long, since only 26 positions can be sliced out of the doubled tables.
+        #   A first rotor with no turnovers never carries, so it just goes around in runs of 26
+        run = 1 + min([(t - pos - 1) % 26 for t in first_turnovers], default=25)
+        run = min(run, len(data) - i)
+
+        # Plugboard and first rotor, the rest of the machine, then first rotor and plugboard once more
+        for j, enter, leave in zip(range(i, i + run), entry_tables[pos + 1:pos + 1 + run],
+                                   exit_tables[pos + 1:pos + 1 + run]):
+            out[j] = leave[wiring[enter[data[j]]]]
+
+        i += run
+        pos = (pos + run) % 26
+
+    positions[rest] = pos
+
+
 class EnigmaMachine:
     def __init__(self, rotors, reflector, positions=None, ring_settings=None, plugboard=None):
         """
-        An implementation of an enigma machine without ring settings ("Ringstellung")
+        An implementation of an enigma machine, including ring settings ("Ringstellung")
         :param rotors: a list of Rotor objects. The position of the rotors will be read as if the list was you looking
             at the physical enigma machine about to use it. That is, the Rotor at index 0 would be the "last" rotor, or
             the one closest to the reflector plate, and the Rotor at index -1 would be the "first" rotor.
+            The machine starts from the current position and ring_setting of each Rotor, but keeps track of both itself
+            from then on (see get_positions() and get_ring_settings()), so the same Rotor objects can be shared between
+            machines. Note this means encode(), set_positions() and set_ring_settings() do not update the position or
+            ring_setting of the Rotor objects themselves, so those go stale once the machine is in use
         :param reflector: the reflector plate
         :param plugboard: a list of strings/tuples/lists describing the plugboard on the machine (google
             "enigma machine plugboard" for information on how the plugboard functions in the machine).
@@ -20,6 +115,18 @@ class EnigmaMachine:
         self.rotors = EnigmaMachine._check_rotors(rotors)
         self.reflector = EnigmaMachine._check_reflector(reflector)
         self.plugboard = EnigmaMachine._check_plugboard(plugboard if plugboard is not None else [])
+
+        # The rotor turnovers never change, so pack them up once for _encode_kernel(). The positions and ring settings
+        #   do change, but are kept here instead of on each Rotor so that machines sharing Rotor objects don't clash.
+        #   The positions are one flat array that the kernel updates in place
+        self._turnovers = [r.turnovers for r in self.rotors]
+        self._positions = array('b', [r.position for r in self.rotors])
+        self._ring_settings = array('b', [r.ring_setting for r in self.rotors])
+        self._right_tables = [r.right_table for r in self.rotors]
+        self._left_tables = [r.left_table for r in self.rotors]
+        self._first_tables = None
+        self._wirings, self._wirings_key = {}, None
+
         if positions is not None:
             self.set_positions(positions)
         if ring_settings is not None:
@@ -30,26 +137,30 @@ class EnigmaMachine:
         Sets the positions of the rotors
         :param positions: a list of integers or chars describing the rotor positions
         """
-        if not isinstance(positions, (list, tuple)):
-            raise TypeError("Positions must be a list, got type: %s" % type(positions))
-        if len(positions) != len(self.rotors):
-            raise ValueError("Incorrect number of positions. Found (%d) positions for (%d) rotors"
-                             % (len(positions), len(self.rotors)))
-        for i, p in enumerate(positions):
-            self.rotors[i].set_position(p)
+        self._positions[:] = self._check_positions(positions)
+
+    def get_positions(self):
+        """
+        Returns the current positions of the rotors
+        :return: a list of integers
+        """
+        return list(self._positions)
 
     def set_ring_settings(self, ring_settings):
         """
         Sets the ring_settings of the rotors
         :param ring_settings: a list of integers or chars describing the rotor ring_settings
         """
-        if not isinstance(ring_settings, (list, tuple)):
-            raise TypeError("Ring_settings must be a list, got type: %s" % type(ring_settings))
-        if len(ring_settings) != len(self.rotors):
-            raise ValueError("Incorrect number of ring_settings. Found (%d) ring_settings for (%d) rotors"
-                             % (len(ring_settings), len(self.rotors)))
-        for i, r in enumerate(ring_settings):
-            self.rotors[i].set_ring_setting(r)
+        self._ring_settings[:] = self._check_ring_settings(ring_settings)
+        for i, r in enumerate(self._ring_settings):
+            self._right_tables[i], self._left_tables[i] = self.rotors[i].tables(r)
+
+    def get_ring_settings(self):
+        """
+        Returns the current ring_settings of the rotors
+        :return: a list of integers
+        """
+        return list(self._ring_settings)
 
     def encode(self, string):
         """
@@ -57,46 +168,149 @@ class EnigmaMachine:
         Can only encode the 26 letters of the alphabet (spaces are automatically removed)
         :param string: the string to encode
         :return: the encoded string
+
+        A first rotor with no turnovers never turns the next rotor, but still keeps going around on its own:
+        >>> EnigmaMachine([Rotor("EKMFLGDQVZNTOWYHXUSPAIBRCJ", [])], REFLECTOR_B).encode("a" * 60)
+        'NRNLINTKBNJTOICVXPTJIQMODHNRNLINTKBNJTOICVXPTJIQMODHNRNLINTK'
         """
-        ret = ""
+        return self.encode_many([string])[0]
 
-        for c in string.lower().replace(" ", ""):
-            v = ord(c) - ord('a')
+    def encode_many(self, strings, positions=None):
+        """
+        Encodes each of the given strings, starting each one from the same rotor positions. This is the same as setting
+            the positions and calling encode() for each string, but only does the setup for the machine once instead of
+            once per string. For lots of short strings (IE: when brute forcing) that setup is a good part of the work,
+            so this is around a third faster there.
+        Afterwards, the rotors are left where the last string finished, just as with encode()
+        :param strings: a list/tuple of strings to encode, following the rules of encode()
+        :param positions: if not None, a list/tuple with a list of rotor positions for each string, following the rules
+            of set_positions(). Otherwise, every string starts from the current positions of the rotors
+        :return: a list of the encoded strings
+        """
+        if not isinstance(strings, (list, tuple)):
+            raise TypeError("Strings must be a list, got type: %s" % type(strings))
+        if positions is not None:
+            if not isinstance(positions, (list, tuple)):
+                raise TypeError("Positions must be a list, got type: %s" % type(positions))
+            if len(positions) != len(strings):
+                raise ValueError("Incorrect number of positions. Found (%d) positions for (%d) strings"
+                                 % (len(positions), len(strings)))
 
-            if v < 0 or v > 25:
-                raise ValueError("Can not encode the character: %s" % c)
+        data = [EnigmaMachine._check_string(s) for s in strings]
+        if positions is not None:
+            positions = [self._check_positions(p) for p in positions]
 
-            # Rotate the rotors first
-            for r in reversed(self.rotors):
-                if not r.rotate():
-                    break
+        entry_tables, exit_tables = self._first_rotor_tables()
+        right_tables, left_tables = self._right_tables, self._left_tables
+        wirings = self._wiring_cache()
 
-            # Send the signals through the plugboard
-            v = self.plugboard[v]
+        # Everything else _encode_kernel() needs that does not change between strings
+        entry_tables, exit_tables = entry_tables * 2, exit_tables * 2
+        first_turnovers = [t for t in range(26) if (self._turnovers[-1] >> t) & 1]
+        carries = tuple(range(len(self.rotors) - 2, -1, -1))
+        turnovers, reflector, rotor_positions = self._turnovers, self.reflector.mapping, self._positions
+        start = rotor_positions[:]
 
-            # Send the signals through the right side of the machine
-            for r in reversed(self.rotors):
-                v = r.right_side(v)
+        ret = []
+        for i, d in enumerate(data):
+            if positions is not None:
+                rotor_positions[:] = positions[i]
+            else:
+                rotor_positions[:] = start
+            out = bytearray(len(d))
 
-            # Bounce off the reflector plate
-            v = self.reflector.reflect(v)
+            _encode_kernel(d, entry_tables, exit_tables, first_turnovers, carries, right_tables, left_tables,
+                           turnovers, rotor_positions, reflector, wirings, out)
 
-            # Send the signals through the left side of the machine
-            for r in self.rotors:
-                v = r.left_side(v)
+            ret.append(out.decode('ascii'))
+        return ret
+
+    def _first_rotor_tables(self):
+        """
+        Returns the first (rightmost) rotor's tables with the plugboard folded into them. That is, entry_tables[p][v]
+            is the signal letter coming out of the first rotor at position p should the key v be pressed, and
+            exit_tables[p][v] is the uppercase ascii letter that lights up should the signal letter v come back into
+            the first rotor at position p.
+        These are cached, and only rebuilt when the first rotor's tables change (IE: its ring_setting was set) or the
+            plugboard is replaced
+        :return: a tuple of (entry_tables, exit_tables)
+        """
+        first_right, first_left = self._right_tables[-1], self._left_tables[-1]
+        if self._first_tables is None or self._first_tables[0] is not first_right \
+                or self._first_tables[1] is not self.plugboard:
+            plugboard_out = bytes.maketrans(bytes(range(26)), self.plugboard.translate(_TO_UPPER))
+            entry_tables = tuple(bytes(right[v] for v in self.plugboard) for right in first_right)
+            exit_tables = tuple(left.translate(plugboard_out) for left in first_left)
+            self._first_tables = (first_right, self.plugboard, entry_tables, exit_tables)
+        return self._first_tables[2:]
+
+    def _wiring_cache(self):
+        """
+        Returns the dictionary that _encode_kernel() memoizes its composed wirings in, keyed by the positions of every
+            rotor but the first. This is kept between calls to encode() so that encoding many messages with the same
+            machine setup (IE: when brute forcing) does not compose the same wirings over and over again.
+        The cache is cleared whenever the tables of any of those rotors change (IE: a ring_setting was set), or the
+            reflector changes
+        :return: a dictionary
+        """
+        key = self._right_tables[:-1] + [self.reflector.mapping]
+        if self._wirings_key != key:
+            self._wirings_key = key
+            self._wirings = {}
+        return self._wirings
+
+    def _check_positions(self, positions):
+        """
+        Checks that the positions are valid for the rotors of this machine
+        :param positions: a list of integers or chars describing the rotor positions
+        :return: an array of integers
+        """
+        if not isinstance(positions, (list, tuple)):
+            raise TypeError("Positions must be a list, got type: %s" % type(positions))
+        if len(positions) != len(self.rotors):
+            raise ValueError("Incorrect number of positions. Found (%d) positions for (%d) rotors"
+                             % (len(positions), len(self.rotors)))
+        return array('b', [Rotor._check_position(p) for p in positions])
+
+    def _check_ring_settings(self, ring_settings):
+        """
+        Checks that the ring_settings are valid for the rotors of this machine
+        :param ring_settings: a list of integers or chars describing the rotor ring_settings
+        :return: an array of integers
+        """
+        if not isinstance(ring_settings, (list, tuple)):
+            raise TypeError("Ring_settings must be a list, got type: %s" % type(ring_settings))
+        if len(ring_settings) != len(self.rotors):
+            raise ValueError("Incorrect number of ring_settings. Found (%d) ring_settings for (%d) rotors"
+                             % (len(ring_settings), len(self.rotors)))
+        return array('b', [Rotor._check_ring_setting(r) for r in ring_settings])
 
-            # Send through the plugboard once more
-            v = self.plugboard[v]
+    @staticmethod
+    def _check_string(string):
+        """
+        Checks that the string can be encoded, and converts it into the signal letters [0, 25] with the spaces removed
+        :param string: the string to encode
+        :return: a bytes of the signal letters
+        """
+        if not isinstance(string, str):
+            raise TypeError("Can only encode strings, got type: %s" % type(string))
+        try:
+            data = string.encode('ascii')
+        except UnicodeEncodeError as e:
+            raise ValueError("Can not encode the character: %s" % string[e.start])
 
-            ret += chr(v + ord('a'))
-        return ret.upper()
+        # Anything left over after deleting the letters and spaces can not be encoded
+        bad = data.translate(None, _LETTERS + b" ")
+        if bad:
+            raise ValueError("Can not encode the character: %s" % chr(bad[0]))
+        return data.translate(_FROM_ASCII, b" ")
 
     @staticmethod
     def _check_rotors(rotors):
         """
         Checks to make sure rotors is correct
         :param rotors: the rotors
-        :return: the same rotors
+        :return: the same rotors, as a tuple
         """
         if not isinstance(rotors, (list, tuple)):
             raise TypeError("Rotors must be a list of rotors, got type: %s" % type(rotors))
@@ -105,7 +319,7 @@ class EnigmaMachine:
         for r in rotors:
             if not isinstance(r, Rotor):
                 raise TypeError("Each rotor must be an instance of the object Rotor, got type: %s" % type(r))
-        return list(rotors)
+        return tuple(rotors)
 
     @staticmethod
     def _check_reflector(reflector):
@@ -121,11 +335,11 @@ class EnigmaMachine:
     @staticmethod
     def _check_plugboard(plugboard):
         """
-        Checks the plugboard is correct, and returns a list where the index refers to the incoming signal letter, and
+        Checks the plugboard is correct, and returns a bytes where the index refers to the incoming signal letter, and
             the value at that index is the signal letter that would come out of the plugboard
         :param plugboard: a list/tuple of either tuples or strings of length 2 describing the plugboard, with no
             letters that map to multiple values.
-        :return: a list of integers
+        :return: a bytes of size 26
         """
         if not isinstance(plugboard, (list, tuple)):
             raise TypeError("Plugboard must be a list, got type: %s" % plugboard)
@@ -179,24 +393,27 @@ class EnigmaMachine:
                                 "type: %s" % type(p))
 
             # Now check for conflicts
-            if p[0] in list(d.keys()) or p[1] in list(d.keys()):
+            if p[0] in d or p[1] in d:
                 raise ValueError("Letters in plugboard map to different values. Found while mapping integers (%d, %d), "
                                  "or chars (%s, %s)" % (p[0], p[1], chr(p[0] + ord('a')), chr(p[1] + ord('a'))))
             d[p[0]] = p[1]
             d[p[1]] = p[0]
 
-        # Make the dictionary into a list just because I like thinking about the plugboard as a list instead as a dict
-        ret = list(range(26))
-        for k in d.keys():
-            ret[k] = d[k]
-        return ret
+        # Turn the dictionary into a 26 byte table indexed by the incoming signal letter, with unplugged letters
+        #   mapping to themselves
+        return bytes(d.get(i, i) for i in range(26))
 
 
 class Rotor:
     def __init__(self, alphabet, turnovers, position=0, ring_setting=0):
         """
         A single rotor in the machine
-        Note: the ring settings or "Ringstellung" is not implemented
+        Note: the ring setting or "Ringstellung" is folded into right_table and left_table whenever it is set, so
+            passing a signal through the rotor never has to account for it
+        Note: position and ring_setting (and so set_position(), set_ring_setting() and rotate()) are only this Rotor's
+            own state. An EnigmaMachine copies them as its starting values when it is made, and from then on keeps
+            track of them itself, so changing them afterwards has no effect on any machine already using this Rotor.
+            Use EnigmaMachine.set_positions()/get_positions() and set_ring_settings()/get_ring_settings() instead
         :param alphabet: the mappings of letters. Should be a string/list/tuple of size 26 where the index of the
             list/tuple would represent the incoming (from the right) signal letter, and the integer/letter would be the
             output (left side) signal letter. Can either enter letter values as integers in the range [0, 25]
@@ -206,63 +423,92 @@ class Rotor:
             the range [0, 25], ['A', 'Z'], or the lowercase ['a', 'z'], or can be a list/tuple of such values denoting
             multiple turnover positions.
             Duplicate turnover positions will be ignored
-        :param position: the current position of the rotor, either integer or char following the rules above
-        :param ring_setting: the position of the ring setting, either integer or char following the rules above
+        :param position: the starting position of the rotor, either integer or char following the rules above
+        :param ring_setting: the starting position of the ring setting, either integer or char following the rules
+            above
         """
         self.increments, self.reverse_increments = Rotor._check_alphabet(alphabet)
+
+        # The wiring tables with no ring setting. These never change, so every table built from them can share rows
+        self._base_right = tuple(bytes((v + self.increments[(v + p) % 26]) % 26 for v in range(26))
+                                 for p in range(26))
+        self._base_left = tuple(bytes((v + self.reverse_increments[(v + p) % 26]) % 26 for v in range(26))
+                                for p in range(26))
+
         self.turnovers = Rotor._check_turnovers(turnovers)
         self.position = Rotor._check_position(position)
         self.ring_setting = Rotor._check_ring_setting(ring_setting)
+        self._rebuild_tables()
 
     def set_position(self, position):
         """
-        Sets the position of this rotor, while checking to make sure it is a correct position
+        Sets the position of this rotor, while checking to make sure it is a correct position. Only affects
+            EnigmaMachines made after this call, see EnigmaMachine.set_positions() for changing a machine's positions
         :param position: the position to set
         """
         self.position = Rotor._check_position(position)
 
     def set_ring_setting(self, ring_setting):
         """
-        Sets the ring_setting of this rotor, while checking to make sure it is a correct position
+        Sets the ring_setting of this rotor, while checking to make sure it is a correct position. Only affects
+            EnigmaMachines made after this call, see EnigmaMachine.set_ring_settings() for changing a machine's
+            ring_settings
         :param ring_setting: the ring_setting to set
         """
         self.ring_setting = Rotor._check_ring_setting(ring_setting)
+        self._rebuild_tables()
 
     def right_side(self, val):
         """
         Returns the signal letter that would be outputted should a signal came in at the letter val (from right to left)
-        :param val: the incoming right signal letter
+        :param val: the incoming right signal letter. Not checked, must be an integer in the range [0, 25]
         :return: the outgoing left signal letter
         """
-        if not isinstance(val, int) or val < 0 or val > 25:
-            raise ValueError("Got erroneous val to pass through rotor: %s" % val)
-        return (val + self.increments[(val + self.position - self.ring_setting) % 26]) % 26
+        return self.right_table[self.position][val]
 
     def left_side(self, val):
         """
         Returns the signal letter that would be outputted should a signal came in at the letter val (from left to right)
-        :param val: the incoming left signal letter
+        :param val: the incoming left signal letter. Not checked, must be an integer in the range [0, 25]
         :return: the outgoing right signal letter
         """
-        if not isinstance(val, int) or val < 0 or val > 25:
-            raise ValueError("Got erroneous val to pass through rotor: %s" % val)
-        return (val + self.reverse_increments[(val + self.position - self.ring_setting) % 26]) % 26
+        return self.left_table[self.position][val]
 
     def rotate(self):
         """
             Rotates the rotor one notch, and returns True if the next rotor to the left would have been rotated as well
         :return: True if the next rotor to the left would have been turned, False otherwise
         """
-        ret = self.position in self.turnovers
-        self.position = (self.position + 1) % 26
-        return ret
+        ret = (self.turnovers >> self.position) & 1
+        self.position = self.position + 1 if self.position < 25 else 0
+        return bool(ret)
+
+    def tables(self, ring_setting):
+        """
+        Returns the right and left tables of this rotor for the given ring setting, where right_table[p][v] is what
+            right_side(v) would return while the rotor is at position p with that ring setting, and likewise for
+            left_table and left_side().
+        The ring setting only shifts which row of the base tables is used, so this just rotates the rows around, and
+            the rows themselves are shared between every table
+        :param ring_setting: the ring setting, as an integer in the range [0, 25]
+        :return: a tuple of (right_table, left_table)
+        """
+        r = ring_setting
+        return self._base_right[-r:] + self._base_right[:-r], self._base_left[-r:] + self._base_left[:-r]
+
+    def _rebuild_tables(self):
+        """
+        Rebuilds right_table and left_table for the current ring_setting. Must be called whenever ring_setting changes
+        """
+        self.right_table, self.left_table = self.tables(self.ring_setting)
 
     @staticmethod
     def _check_alphabet(alphabet):
         """
         Checks if the alphabet is a working alphabet, and converts to ints
         :param alphabet: the alphabet
-        :return: a list/tuple of ints to use as the rotor alphabet (will be a list of increments)
+        :return: the increments and the reverse increments of the rotor alphabet, each as a bytes of size 26 with the
+            increments taken mod 26
         """
         if isinstance(alphabet, str):
             alphabet = [c for c in alphabet]
@@ -298,20 +544,23 @@ class Rotor:
                 raise TypeError("Rotor alphabet elements must be either an integer or a char, instead got type: %s"
                                 % type(a))
 
-        for i in range(26):
-            if i not in ret:
-                raise ValueError("Rotor alphabet must contain every letter exactly once")
+        # Every value is already known to be in [0, 25], so 26 distinct values means every letter is there once
+        if len(set(ret)) != 26:
+            raise ValueError("Rotor alphabet must contain every letter exactly once")
 
-        # Finally, convert the alphabet into the increments, and do the reverse alphabet
-        return [r - i for i, r in enumerate(ret)], \
-            [r - i for i, r in enumerate([ret.index(i) for i in range(26)])]
+        # Finally, convert the alphabet into the increments, and do the reverse alphabet. Every use of the increments
+        #   wraps around mod 26 anyway, so they can be stored mod 26 in a flat bytes
+        reverse = [0] * 26
+        for i, r in enumerate(ret):
+            reverse[r] = i
+        return bytes((r - i) % 26 for i, r in enumerate(ret)), bytes((r - i) % 26 for i, r in enumerate(reverse))
 
     @staticmethod
     def _check_turnovers(turnovers):
         """
-        Check whether or not this is a valid turnover or turnover list, returns a list of integers
+        Check whether or not this is a valid turnover or turnover list, returns a bitmask of the turnover positions
         :param turnovers: a single integer/letter describing a turnover position, or a list of such turnovers
-        :return: a list of integers
+        :return: an integer with bit i set if i is a turnover position
         """
         if isinstance(turnovers, (int, str, float)):
             turnovers = [turnovers]
@@ -341,7 +590,7 @@ class Rotor:
                 ret.append(v)
             else:
                 raise TypeError("Rotor turnovers must be either integers or chars, got type: %s" % type(t))
-        return list(set(ret))
+        return sum(1 << t for t in set(ret))
 
     @staticmethod
     def _check_position(position):
@@ -397,11 +646,9 @@ class Reflector:
     def reflect(self, val):
         """
         Returns the signal letter after reflecting the incoming signal letter val
-        :param val: the incoming signal
+        :param val: the incoming signal. Not checked, must be an integer in the range [0, 25]
         :return: the reflected signal
         """
-        if not isinstance(val, int) or val < 0 or val > 25:
-            raise ValueError("Got an erroneous val to reflect: %s" % val)
         return self.mapping[val]
 
     @staticmethod